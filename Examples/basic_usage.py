@@ -7,58 +7,85 @@ This script demonstrates basic usage of the OpenClawUE Python API.
 
 import sys
 import os
+import importlib.util
 
-# Add the Python module to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Python'))
+def _load_in_tree_package():
+    """Load openclawue from this checkout without adding it to sys.path."""
+    package_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python', 'openclawue')
+    spec = importlib.util.spec_from_file_location(
+        'openclawue',
+        os.path.join(package_dir, '__init__.py'),
+        submodule_search_locations=[package_dir]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['openclawue'] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules['openclawue']
+        raise
+    return module
 
 try:
-    import openclawue
+    try:
+        import openclawue
+    except ImportError:
+        # Not installed (see Python/pyproject.toml); use the copy in this checkout
+        openclawue = _load_in_tree_package()
     print(f"OpenClawUE version: {openclawue.__version__}")
-except ImportError as e:
+except (ImportError, OSError) as e:
     print(f"Error importing OpenClawUE: {e}")
     print("Make sure the plugin is installed and Python path is set correctly.")
     sys.exit(1)
 
+def _write(lines):
+    """Write collected output lines with a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def test_basic_functionality():
     """Test basic OpenClawUE functionality."""
-    print("\n=== Testing Basic Functionality ===")
+    out = []
+    out.append("\n=== Testing Basic Functionality ===")
     
     # Check if Unreal Engine is available
     if openclawue.is_unreal_available():
-        print("✓ Unreal Engine Python API is available")
+        out.append("✓ Unreal Engine Python API is available")
     else:
-        print("✗ Unreal Engine Python API not available (running in stub mode)")
+        out.append("✗ Unreal Engine Python API not available (running in stub mode)")
     
     # Test service instantiation
     try:
         blueprint_service = openclawue.BlueprintService
-        print("✓ BlueprintService initialized")
+        out.append("✓ BlueprintService initialized")
     except Exception as e:
-        print(f"✗ Failed to initialize BlueprintService: {e}")
+        out.append(f"✗ Failed to initialize BlueprintService: {e}")
     
     # Test Python execution
-    print("\n=== Testing Python Execution ===")
+    out.append("\n=== Testing Python Execution ===")
     result = openclawue.execute_python("print('Hello from OpenClawUE!')")
     if result.get("success"):
-        print(f"✓ Python execution successful")
+        out.append(f"✓ Python execution successful")
         if result.get("stdout"):
-            print(f"  Output: {result['stdout']}")
+            out.append(f"  Output: {result['stdout']}")
     else:
-        print(f"✗ Python execution failed: {result.get('stderr', 'Unknown error')}")
+        out.append(f"✗ Python execution failed: {result.get('stderr', 'Unknown error')}")
     
     # List subsystems
-    print("\n=== Testing Subsystem Discovery ===")
+    out.append("\n=== Testing Subsystem Discovery ===")
     subsystems = openclawue.list_subsystems()
     if subsystems:
-        print(f"✓ Found {len(subsystems)} subsystems:")
+        out.append(f"✓ Found {len(subsystems)} subsystems:")
         for subsystem in subsystems:
-            print(f"  - {subsystem}")
+            out.append(f"  - {subsystem}")
     else:
-        print("✗ No subsystems found (may be in stub mode)")
+        out.append("✗ No subsystems found (may be in stub mode)")
+    
+    _write(out)
 
 def test_blueprint_creation():
     """Test Blueprint creation functionality."""
-    print("\n=== Testing Blueprint Creation ===")
+    out = []
+    out.append("\n=== Testing Blueprint Creation ===")
     
     try:
         service = openclawue.BlueprintService
@@ -71,11 +98,11 @@ def test_blueprint_creation():
         )
         
         if result.get("success"):
-            print(f"✓ Blueprint creation successful")
-            print(f"  Asset path: {result.get('asset_path')}")
-            print(f"  Message: {result.get('message')}")
+            out.append(f"✓ Blueprint creation successful")
+            out.append(f"  Asset path: {result.get('asset_path')}")
+            out.append(f"  Message: {result.get('message')}")
         else:
-            print(f"✗ Blueprint creation failed: {result.get('error', 'Unknown error')}")
+            out.append(f"✗ Blueprint creation failed: {result.get('error', 'Unknown error')}")
         
         # Add a variable
         if result.get("success"):
@@ -87,26 +114,29 @@ def test_blueprint_creation():
             )
             
             if var_result.get("success"):
-                print(f"✓ Variable added successfully")
-                print(f"  Variable: {var_result.get('variable_name')}")
-                print(f"  Type: {var_result.get('variable_type')}")
+                out.append(f"✓ Variable added successfully")
+                out.append(f"  Variable: {var_result.get('variable_name')}")
+                out.append(f"  Type: {var_result.get('variable_type')}")
             else:
-                print(f"✗ Failed to add variable: {var_result.get('error', 'Unknown error')}")
+                out.append(f"✗ Failed to add variable: {var_result.get('error', 'Unknown error')}")
         
         # Compile blueprint
         if result.get("success"):
             compile_result = service.compile_blueprint(result["asset_path"])
             if compile_result.get("success"):
-                print(f"✓ Blueprint compiled successfully")
+                out.append(f"✓ Blueprint compiled successfully")
             else:
-                print(f"✗ Failed to compile blueprint: {compile_result.get('error', 'Unknown error')}")
+                out.append(f"✗ Failed to compile blueprint: {compile_result.get('error', 'Unknown error')}")
                 
     except Exception as e:
-        print(f"✗ Exception during blueprint test: {e}")
+        out.append(f"✗ Exception during blueprint test: {e}")
+    
+    _write(out)
 
 def test_openclaw_integration():
     """Test OpenClaw integration."""
-    print("\n=== Testing OpenClaw Integration ===")
+    out = []
+    out.append("\n=== Testing OpenClaw Integration ===")
     
     try:
         service = openclawue.OpenClawService
@@ -114,10 +144,10 @@ def test_openclaw_integration():
         # Connect to OpenClaw
         connect_result = service.connect_to_openclaw()
         if connect_result.get("success"):
-            print(f"✓ Connected to OpenClaw Gateway")
-            print(f"  URL: {connect_result.get('url')}")
+            out.append(f"✓ Connected to OpenClaw Gateway")
+            out.append(f"  URL: {connect_result.get('url')}")
         else:
-            print(f"✗ Failed to connect to OpenClaw: {connect_result.get('error', 'Unknown error')}")
+            out.append(f"✗ Failed to connect to OpenClaw: {connect_result.get('error', 'Unknown error')}")
         
         # Send a test command
         if connect_result.get("success"):
@@ -127,38 +157,44 @@ def test_openclaw_integration():
             })
             
             if command_result.get("success"):
-                print(f"✓ Command sent successfully")
-                print(f"  Response: {command_result.get('response', {})}")
+                out.append(f"✓ Command sent successfully")
+                out.append(f"  Response: {command_result.get('response', {})}")
             else:
-                print(f"✗ Failed to send command: {command_result.get('error', 'Unknown error')}")
+                out.append(f"✗ Failed to send command: {command_result.get('error', 'Unknown error')}")
         
         # Create dashboard
         dashboard_result = service.create_dashboard()
         if dashboard_result.get("success"):
-            print(f"✓ Dashboard created")
-            print(f"  URL: {dashboard_result.get('dashboard_url')}")
+            out.append(f"✓ Dashboard created")
+            out.append(f"  URL: {dashboard_result.get('dashboard_url')}")
         else:
-            print(f"✗ Failed to create dashboard: {dashboard_result.get('error', 'Unknown error')}")
+            out.append(f"✗ Failed to create dashboard: {dashboard_result.get('error', 'Unknown error')}")
             
     except Exception as e:
-        print(f"✗ Exception during OpenClaw test: {e}")
+        out.append(f"✗ Exception during OpenClaw test: {e}")
+    
+    _write(out)
 
 def main():
     """Main function."""
-    print("OpenClawUE Basic Usage Example")
-    print("=" * 50)
+    out = []
+    out.append("OpenClawUE Basic Usage Example")
+    out.append("=" * 50)
+    _write(out)
     
     test_basic_functionality()
     test_blueprint_creation()
     test_openclaw_integration()
     
-    print("\n" + "=" * 50)
-    print("Example completed!")
-    print("\nNext steps:")
-    print("1. Install the OpenClawUE plugin in your Unreal Engine project")
-    print("2. Enable the plugin and restart the editor")
-    print("3. Run this script with Unreal Engine Python environment")
-    print("4. Explore the full API with discover_module() and discover_class()")
+    out = []
+    out.append("\n" + "=" * 50)
+    out.append("Example completed!")
+    out.append("\nNext steps:")
+    out.append("1. Install the OpenClawUE plugin in your Unreal Engine project")
+    out.append("2. Enable the plugin and restart the editor")
+    out.append("3. Run this script with Unreal Engine Python environment")
+    out.append("4. Explore the full API with discover_module() and discover_class()")
+    _write(out)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,30 +10,22 @@ __author__ = "OpenClawUE Contributors"
 __license__ = "MIT"
 
 import sys
+import io
 import json
-from typing import Any, Dict, List, Optional, Union
+import functools
+import contextlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Try to import Unreal Engine Python API
 try:
     import unreal
-    _UNREAL_AVAILABLE = True
 except ImportError:
-    _UNREAL_AVAILABLE = False
+    # Cache the miss so later 'import unreal' attempts fail without
+    # searching sys.path again
+    sys.modules['unreal'] = None
     print("Warning: Unreal Engine Python API not available. Running in stub mode.")
 
-# Service imports
-from .services import (
-    BlueprintService,
-    MaterialService,
-    WidgetService,
-    ActorService,
-    AnimationService,
-    NiagaraService,
-    InputService,
-    AssetService,
-    OpenClawService
-)
-
 # Export services
 __all__ = [
     'BlueprintService',
@@ -49,42 +41,42 @@ __all__ = [
     'discover_class',
     'execute_python',
     'list_subsystems',
+    'refresh_subsystems',
     'is_unreal_available'
 ]
 
-# Service instances
-_blueprint_service = None
-_material_service = None
-_widget_service = None
-_actor_service = None
-_animation_service = None
-_niagara_service = None
-_input_service = None
-_asset_service = None
-_openclaw_service = None
-
-def _get_service(service_class, instance_attr):
-    """Lazy-load service instance."""
-    global _blueprint_service, _material_service, _widget_service
-    global _actor_service, _animation_service, _niagara_service
-    global _input_service, _asset_service, _openclaw_service
-    
-    instance = globals().get(instance_attr)
-    if instance is None:
-        instance = service_class()
-        globals()[instance_attr] = instance
-    return instance
-
-# Service properties
-BlueprintService = property(lambda self: _get_service(BlueprintService, '_blueprint_service'))
-MaterialService = property(lambda self: _get_service(MaterialService, '_material_service'))
-WidgetService = property(lambda self: _get_service(WidgetService, '_widget_service'))
-ActorService = property(lambda self: _get_service(ActorService, '_actor_service'))
-AnimationService = property(lambda self: _get_service(AnimationService, '_animation_service'))
-NiagaraService = property(lambda self: _get_service(NiagaraService, '_niagara_service'))
-InputService = property(lambda self: _get_service(InputService, '_input_service'))
-AssetService = property(lambda self: _get_service(AssetService, '_asset_service'))
-OpenClawService = property(lambda self: _get_service(OpenClawService, '_openclaw_service'))
+# Services are loaded lazily on first access (PEP 562)
+_SERVICE_NAMES = frozenset({
+    'BlueprintService',
+    'MaterialService',
+    'WidgetService',
+    'ActorService',
+    'AnimationService',
+    'NiagaraService',
+    'InputService',
+    'AssetService',
+    'OpenClawService'
+})
+
+# Serializes first-time service construction across threads
+_service_lock = threading.Lock()
+
+def __getattr__(name: str) -> Any:
+    """Import the services module and return the requested service instance."""
+    if name in _SERVICE_NAMES:
+        from . import services
+        with _service_lock:
+            # Another thread may have built it while this one waited
+            instance = globals().get(name)
+            if instance is None:
+                instance = getattr(services, name)()
+                globals()[name] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> List[str]:
+    """List module attributes, including services not yet loaded."""
+    return sorted(set(globals()) | _SERVICE_NAMES)
 
 def is_unreal_available() -> bool:
     """
@@ -93,7 +85,8 @@ def is_unreal_available() -> bool:
     Returns:
         bool: True if Unreal Engine Python API is available
     """
-    return _UNREAL_AVAILABLE
+    # sys.modules is the single source of truth; a cached miss is stored as None
+    return sys.modules.get('unreal') is not None
 
 def discover_module(module_name: str, **kwargs) -> Dict[str, Any]:
     """
@@ -106,7 +99,7 @@ def discover_module(module_name: str, **kwargs) -> Dict[str, Any]:
     Returns:
         Dict containing module information
     """
-    if not _UNREAL_AVAILABLE:
+    if not is_unreal_available():
         return {"error": "Unreal Engine Python API not available"}
     
     # This would be implemented by the C++ side
@@ -129,7 +122,7 @@ def discover_class(class_name: str, **kwargs) -> Dict[str, Any]:
     Returns:
         Dict containing class information
     """
-    if not _UNREAL_AVAILABLE:
+    if not is_unreal_available():
         return {"error": "Unreal Engine Python API not available"}
     
     # This would be implemented by the C++ side
@@ -141,65 +134,117 @@ def discover_class(class_name: str, **kwargs) -> Dict[str, Any]:
         "inheritance": []
     }
 
+@functools.lru_cache(maxsize=256)
+def _compile_exec(code: str) -> Any:
+    """Compile a snippet for exec(), reusing recently compiled code objects."""
+    return compile(code, "<openclaw>", "exec")
+
+# Free list of reusable stdout/stderr capture buffers
+_capture_buffers: List[io.StringIO] = []
+
+# redirect_stdout/redirect_stderr swap sys.stdout/sys.stderr for the whole
+# process, so overlapping redirects from different threads would restore the
+# wrong stream. Snippets therefore run one at a time; the lock is reentrant so
+# a snippet can still call execute_python itself.
+_exec_lock = threading.RLock()
+
+def _take_buffer() -> io.StringIO:
+    """Take a capture buffer from the free list, or create one."""
+    try:
+        return _capture_buffers.pop()
+    except IndexError:
+        return io.StringIO()
+
 def execute_python(code: str) -> Dict[str, Any]:
     """
     Execute Python code in Unreal Engine context.
     
+    Snippets run one at a time. While one runs, output written by other
+    threads is captured into its result as well.
+    
     Args:
         code: Python code to execute
         
     Returns:
         Dict containing execution results
     """
-    if not _UNREAL_AVAILABLE:
+    if not is_unreal_available():
         return {
             "stdout": "",
             "stderr": "Unreal Engine Python API not available",
             "success": False
         }
     
+    # Buffers are taken from the free list rather than shared, so a snippet
+    # that calls execute_python itself gets its own pair
+    out = _take_buffer()
+    err = _take_buffer()
     try:
         # Execute the code
-        exec_globals = {'unreal': unreal}
-        exec(code, exec_globals)
+        exec_globals = {'unreal': sys.modules['unreal']}
+        with _exec_lock, contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            exec(_compile_exec(code), exec_globals)
         
         return {
-            "stdout": "Execution completed",
-            "stderr": "",
+            "stdout": out.getvalue(),
+            "stderr": err.getvalue(),
             "success": True
         }
     except Exception as e:
+        stderr = err.getvalue()
+        if stderr and not stderr.endswith("\n"):
+            stderr += "\n"
         return {
-            "stdout": "",
-            "stderr": str(e),
+            "stdout": out.getvalue(),
+            "stderr": stderr + str(e),
             "success": False
         }
+    finally:
+        for buffer in (out, err):
+            buffer.seek(0)
+            buffer.truncate()
+            _capture_buffers.append(buffer)
+
+@functools.lru_cache(maxsize=None)
+def _query_subsystems() -> Tuple[str, ...]:
+    """Query the editor for subsystem names; cached after the first success."""
+    # This is a simplified version
+    # In reality, we'd query the editor for all subsystems
+    return (
+        "LevelEditorSubsystem",
+        "EditorAssetLibrary",
+        "EditorLevelLibrary",
+        "EditorUtilityLibrary"
+    )
 
 def list_subsystems() -> List[str]:
     """
     List available Unreal Engine editor subsystems.
     
+    The editor is only queried once; call refresh_subsystems() to force
+    a refresh.
+    
     Returns:
         List of subsystem names
     """
-    if not _UNREAL_AVAILABLE:
+    if not is_unreal_available():
         return []
     
     try:
-        # This is a simplified version
-        # In reality, we'd query the editor for all subsystems
-        subsystems = [
-            "LevelEditorSubsystem",
-            "EditorAssetLibrary",
-            "EditorLevelLibrary",
-            "EditorUtilityLibrary"
-        ]
-        return subsystems
+        return list(_query_subsystems())
     except Exception:
         return []
 
+def refresh_subsystems() -> None:
+    """
+    Discard the cached subsystem list.
+    
+    The next call to list_subsystems() queries the editor again.
+    """
+    _query_subsystems.cache_clear()
+
 # Initialize services on module import
-if _UNREAL_AVAILABLE:
+if is_unreal_available():
     print(f"OpenClawUE {__version__} initialized with Unreal Engine Python API")
 else:
     print(f"OpenClawUE {__version__} initialized in stub mode")
\ No newline at end of file
@@ -5,39 +5,94 @@ Python services for Unreal Engine control through OpenClaw.
 """
 
 from typing import Any, Dict, List, Optional, Union
-import json
+import sys
+import atexit
+import functools
+import queue
+import threading
 
+# Prefer orjson's C encoder when installed. Its output is decoded back to
+# str so frames stay text frames, non-str dict keys are accepted, and the
+# json fallback uses the same compact separators, so both produce identical
+# frames for ordinary commands. They still differ on edge cases: orjson
+# writes NaN and Infinity as null (json.dumps emits the non-standard
+# NaN/Infinity tokens), rejects integers beyond 64 bits, and natively
+# encodes dataclasses, datetimes and UUIDs, which json.dumps rejects.
 try:
-    import unreal
-    _UNREAL_AVAILABLE = True
+    from orjson import dumps as _orjson_dumps, OPT_NON_STR_KEYS as _ORJSON_OPTIONS
+    
+    def _json_dumps(obj: Any) -> str:
+        """Encode obj to a JSON string using orjson."""
+        return _orjson_dumps(obj, option=_ORJSON_OPTIONS).decode()
 except ImportError:
-    _UNREAL_AVAILABLE = False
+    import json
+    
+    _json_dumps = functools.partial(json.dumps, separators=(",", ":"))
 
+# Shape of every error response; copied and filled in by _format_error
+_ERR_TEMPLATE = {"success": False, "error": "", "error_type": ""}
 
-class BaseService:
-    """Base class for all OpenClawUE services."""
+# Static response messages
+_MSG_UNREAL_UNAVAILABLE = "Unreal Engine Python API not available"
+_MSG_BLUEPRINT_CREATED = "Blueprint '%s' created successfully"
+_MSG_MATERIAL_CREATED = "Material '%s' created successfully"
+_MSG_MATERIAL_INSTANCE_CREATED = "Material Instance '%s' created successfully"
+_MSG_WIDGET_BLUEPRINT_CREATED = "Widget Blueprint '%s' created successfully"
+_MSG_ANIMATION_SEQUENCE_CREATED = "Animation Sequence '%s' created successfully"
+_MSG_NIAGARA_SYSTEM_CREATED = "Niagara System '%s' created successfully"
+_MSG_INPUT_ACTION_CREATED = "Input Action '%s' created successfully"
+
+# Maximum number of commands waiting to be sent to the gateway
+_SEND_QUEUE_SIZE = 1024
+
+# Queued by disconnect_from_openclaw() to stop the sender thread
+_SEND_STOP = object()
+
+
+def _requires_unreal(method):
+    """
+    Guard a service method on the Unreal Engine Python API.
     
-    def __init__(self):
-        self._unreal_available = _UNREAL_AVAILABLE
+    The wrapped method only runs when Unreal is available; otherwise, or if
+    the method raises, the error is returned as a formatted response.
+    """
+    modules = sys.modules
     
-    def _check_unreal(self) -> bool:
-        """Check if Unreal Engine Python API is available."""
-        if not self._unreal_available:
-            raise RuntimeError("Unreal Engine Python API not available")
-        return True
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if modules.get("unreal") is None:
+            return self._format_error(RuntimeError(_MSG_UNREAL_UNAVAILABLE))
+        try:
+            return method(self, *args, **kwargs)
+        except Exception as e:
+            return self._format_error(e)
+    return wrapper
+
+
+def _asset_created(message: str, name: str, path: str) -> Dict[str, Any]:
+    """Build the success response shared by all asset-creation methods."""
+    return {
+        "success": True,
+        "asset_path": path + "/" + name,
+        "message": message % name
+    }
+
+
+class BaseService:
+    """Base class for all OpenClawUE services."""
     
     def _format_error(self, error: Exception) -> Dict[str, Any]:
         """Format error response."""
-        return {
-            "success": False,
-            "error": str(error),
-            "error_type": type(error).__name__
-        }
+        response = _ERR_TEMPLATE.copy()
+        response["error"] = str(error)
+        response["error_type"] = type(error).__name__
+        return response
 
 
 class BlueprintService(BaseService):
     """Service for Blueprint creation and manipulation."""
     
+    @_requires_unreal
     def create_blueprint(self, name: str, parent_class: str, path: str) -> Dict[str, Any]:
         """
         Create a new Blueprint asset.
@@ -50,19 +105,11 @@ class BlueprintService(BaseService):
         Returns:
             Dict containing creation results
         """
-        try:
-            self._check_unreal()
-            
-            # This would call the actual Unreal API
-            # For now, return stub response
-            return {
-                "success": True,
-                "asset_path": f"{path}/{name}",
-                "message": f"Blueprint '{name}' created successfully"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        # This would call the actual Unreal API
+        # For now, return stub response
+        return _asset_created(_MSG_BLUEPRINT_CREATED, name, path)
     
+    @_requires_unreal
     def add_variable(self, blueprint_path: str, name: str, var_type: str, 
                     default_value: str = "") -> Dict[str, Any]:
         """
@@ -77,18 +124,14 @@ class BlueprintService(BaseService):
         Returns:
             Dict containing operation results
         """
-        try:
-            self._check_unreal()
-            
-            return {
-                "success": True,
-                "variable_name": name,
-                "variable_type": var_type,
-                "message": f"Variable '{name}' added to {blueprint_path}"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        return {
+            "success": True,
+            "variable_name": name,
+            "variable_type": var_type,
+            "message": f"Variable '{name}' added to {blueprint_path}"
+        }
     
+    @_requires_unreal
     def compile_blueprint(self, blueprint_path: str) -> Dict[str, Any]:
         """
         Compile a Blueprint.
@@ -99,20 +142,16 @@ class BlueprintService(BaseService):
         Returns:
             Dict containing compilation results
         """
-        try:
-            self._check_unreal()
-            
-            return {
-                "success": True,
-                "message": f"Blueprint {blueprint_path} compiled successfully"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        return {
+            "success": True,
+            "message": f"Blueprint {blueprint_path} compiled successfully"
+        }
 
 
 class MaterialService(BaseService):
     """Service for Material creation and manipulation."""
     
+    @_requires_unreal
     def create_material(self, name: str, path: str) -> Dict[str, Any]:
         """
         Create a new Material asset.
@@ -124,17 +163,9 @@ class MaterialService(BaseService):
         Returns:
             Dict containing creation results
         """
-        try:
-            self._check_unreal()
-            
-            return {
-                "success": True,
-                "asset_path": f"{path}/{name}",
-                "message": f"Material '{name}' created successfully"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        return _asset_created(_MSG_MATERIAL_CREATED, name, path)
     
+    @_requires_unreal
     def create_material_instance(self, parent_material: str, name: str, 
                                 path: str) -> Dict[str, Any]:
         """
@@ -148,21 +179,13 @@ class MaterialService(BaseService):
         Returns:
             Dict containing creation results
         """
-        try:
-            self._check_unreal()
-            
-            return {
-                "success": True,
-                "asset_path": f"{path}/{name}",
-                "message": f"Material Instance '{name}' created successfully"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        return _asset_created(_MSG_MATERIAL_INSTANCE_CREATED, name, path)
 
 
 class WidgetService(BaseService):
     """Service for UMG Widget creation and manipulation."""
     
+    @_requires_unreal
     def create_widget_blueprint(self, name: str, path: str, 
                                parent_class: str = "UserWidget") -> Dict[str, Any]:
         """
@@ -176,17 +199,9 @@ class WidgetService(BaseService):
         Returns:
             Dict containing creation results
         """
-        try:
-            self._check_unreal()
-            
-            return {
-                "success": True,
-                "asset_path": f"{path}/{name}",
-                "message": f"Widget Blueprint '{name}' created successfully"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        return _asset_created(_MSG_WIDGET_BLUEPRINT_CREATED, name, path)
     
+    @_requires_unreal
     def add_widget_component(self, widget_path: str, component_type: str, 
                             name: str, parent: str = "") -> Dict[str, Any]:
         """
@@ -201,22 +216,18 @@ class WidgetService(BaseService):
         Returns:
             Dict containing operation results
         """
-        try:
-            self._check_unreal()
-            
-            return {
-                "success": True,
-                "component_name": name,
-                "component_type": component_type,
-                "message": f"Component '{name}' added to {widget_path}"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        return {
+            "success": True,
+            "component_name": name,
+            "component_type": component_type,
+            "message": f"Component '{name}' added to {widget_path}"
+        }
 
 
 class ActorService(BaseService):
     """Service for Level Actor manipulation."""
     
+    @_requires_unreal
     def spawn_actor(self, actor_class: str, location: List[float], 
                    rotation: List[float] = None) -> Dict[str, Any]:
         """
@@ -230,22 +241,18 @@ class ActorService(BaseService):
         Returns:
             Dict containing spawn results
         """
-        try:
-            self._check_unreal()
-            
-            if rotation is None:
-                rotation = [0.0, 0.0, 0.0]
-            
-            return {
-                "success": True,
-                "actor_class": actor_class,
-                "location": location,
-                "rotation": rotation,
-                "message": f"Actor of class '{actor_class}' spawned successfully"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        if rotation is None:
+            rotation = [0.0, 0.0, 0.0]
+        
+        return {
+            "success": True,
+            "actor_class": actor_class,
+            "location": location,
+            "rotation": rotation,
+            "message": f"Actor of class '{actor_class}' spawned successfully"
+        }
     
+    @_requires_unreal
     def get_all_actors(self) -> Dict[str, Any]:
         """
         Get all actors in the current level.
@@ -253,23 +260,19 @@ class ActorService(BaseService):
         Returns:
             Dict containing actor list
         """
-        try:
-            self._check_unreal()
-            
-            # Stub response
-            return {
-                "success": True,
-                "actors": [],
-                "count": 0,
-                "message": "No actors in level (stub mode)"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        # Stub response
+        return {
+            "success": True,
+            "actors": [],
+            "count": 0,
+            "message": "No actors in level (stub mode)"
+        }
 
 
 class AnimationService(BaseService):
     """Service for Animation system control."""
     
+    @_requires_unreal
     def create_animation_sequence(self, name: str, path: str, 
                                  skeleton: str = "") -> Dict[str, Any]:
         """
@@ -283,21 +286,13 @@ class AnimationService(BaseService):
         Returns:
             Dict containing creation results
         """
-        try:
-            self._check_unreal()
-            
-            return {
-                "success": True,
-                "asset_path": f"{path}/{name}",
-                "message": f"Animation Sequence '{name}' created successfully"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        return _asset_created(_MSG_ANIMATION_SEQUENCE_CREATED, name, path)
 
 
 class NiagaraService(BaseService):
     """Service for Niagara VFX system control."""
     
+    @_requires_unreal
     def create_niagara_system(self, name: str, path: str, 
                              template: str = "minimal") -> Dict[str, Any]:
         """
@@ -311,21 +306,13 @@ class NiagaraService(BaseService):
         Returns:
             Dict containing creation results
         """
-        try:
-            self._check_unreal()
-            
-            return {
-                "success": True,
-                "asset_path": f"{path}/{name}",
-                "message": f"Niagara System '{name}' created successfully"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        return _asset_created(_MSG_NIAGARA_SYSTEM_CREATED, name, path)
 
 
 class InputService(BaseService):
     """Service for Enhanced Input system control."""
     
+    @_requires_unreal
     def create_input_action(self, name: str, path: str, 
                            value_type: str = "boolean") -> Dict[str, Any]:
         """
@@ -339,21 +326,13 @@ class InputService(BaseService):
         Returns:
             Dict containing creation results
         """
-        try:
-            self._check_unreal()
-            
-            return {
-                "success": True,
-                "asset_path": f"{path}/{name}",
-                "message": f"Input Action '{name}' created successfully"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        return _asset_created(_MSG_INPUT_ACTION_CREATED, name, path)
 
 
 class AssetService(BaseService):
     """Service for Asset discovery and management."""
     
+    @_requires_unreal
     def search_assets(self, search_term: str = "", 
                      asset_type: str = "") -> Dict[str, Any]:
         """
@@ -366,18 +345,13 @@ class AssetService(BaseService):
         Returns:
             Dict containing search results
         """
-        try:
-            self._check_unreal()
-            
-            # Stub response
-            return {
-                "success": True,
-                "assets": [],
-                "count": 0,
-                "message": "No assets found (stub mode)"
-            }
-        except Exception as e:
-            return self._format_error(e)
+        # Stub response
+        return {
+            "success": True,
+            "assets": [],
+            "count": 0,
+            "message": "No assets found (stub mode)"
+        }
 
 
 class OpenClawService(BaseService):
@@ -386,6 +360,11 @@ class OpenClawService(BaseService):
     def __init__(self):
         super().__init__()
         self._connected = False
+        self._socket = None
+        # Guards the connection state below against concurrent send/disconnect
+        self._send_lock = threading.Lock()
+        self._send_queue = None
+        self._sender_thread = None
     
     def connect_to_openclaw(self, url: str = "ws://127.0.0.1:18789") -> Dict[str, Any]:
         """
@@ -398,9 +377,23 @@ class OpenClawService(BaseService):
             Dict containing connection results
         """
         try:
-            # This would establish WebSocket connection
-            # For now, just mark as connected
-            self._connected = True
+            with self._send_lock:
+                if self._socket is None:
+                    self._socket = self._open_socket(url)
+                self._connected = True
+                
+                # Batched sending only starts once there is a socket to write to
+                if self._socket is not None and self._sender_thread is None:
+                    # A fresh queue per sender, so nothing left over from an
+                    # earlier connection can reach it
+                    self._send_queue = queue.Queue(maxsize=_SEND_QUEUE_SIZE)
+                    self._sender_thread = threading.Thread(
+                        target=self._send_loop, args=(self._send_queue,),
+                        name="OpenClawSender", daemon=True
+                    )
+                    self._sender_thread.start()
+                    # Flush anything still queued before the interpreter exits
+                    atexit.register(self.disconnect_from_openclaw)
             
             return {
                 "success": True,
@@ -411,10 +404,51 @@ class OpenClawService(BaseService):
         except Exception as e:
             return self._format_error(e)
     
+    def disconnect_from_openclaw(self) -> Dict[str, Any]:
+        """
+        Disconnect from OpenClaw Gateway.
+        
+        Commands already queued are sent before the connection is closed.
+        
+        Returns:
+            Dict containing disconnection results
+        """
+        try:
+            with self._send_lock:
+                self._connected = False
+                sender = self._sender_thread
+                if sender is not None:
+                    # Sends hold the lock while queueing, so the sentinel is
+                    # the last item and every queued command is flushed first
+                    self._send_queue.put(_SEND_STOP)
+                    self._sender_thread = None
+                    self._send_queue = None
+            
+            if sender is not None:
+                sender.join()
+                atexit.unregister(self.disconnect_from_openclaw)
+            
+            with self._send_lock:
+                if self._sender_thread is None:
+                    # This would close the WebSocket connection
+                    self._socket = None
+            
+            return {
+                "success": True,
+                "connected": False,
+                "message": "Disconnected from OpenClaw Gateway"
+            }
+        except Exception as e:
+            return self._format_error(e)
+    
     def send_to_openclaw(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send command to OpenClaw.
         
+        Once a gateway socket is open, commands are queued and sent by a
+        background thread, which batches everything pending into a single
+        frame.
+        
         Args:
             command: Command dictionary
             
@@ -422,21 +456,72 @@ class OpenClawService(BaseService):
             Dict containing response
         """
         try:
-            if not self._connected:
+            with self._send_lock:
+                if not self._connected:
+                    return {
+                        "success": False,
+                        "error": "Not connected to OpenClaw"
+                    }
+                
+                send_queue = self._send_queue
+                if send_queue is not None:
+                    # Encode up front so a bad command fails here, not in the batch
+                    try:
+                        send_queue.put_nowait(_json_dumps(command))
+                    except queue.Full:
+                        return {
+                            "success": False,
+                            "error": "OpenClaw send queue is full"
+                        }
+            
+            if send_queue is None:
+                # Stub response
                 return {
-                    "success": False,
-                    "error": "Not connected to OpenClaw"
+                    "success": True,
+                    "command": command,
+                    "response": {"status": "received", "message": "Command processed (stub)"}
                 }
             
-            # Stub response
             return {
                 "success": True,
                 "command": command,
-                "response": {"status": "received", "message": "Command processed (stub)"}
+                "queued": True,
+                "response": {"status": "queued", "message": "Command queued for delivery"}
             }
         except Exception as e:
             return self._format_error(e)
     
+    def _open_socket(self, url: str) -> Any:
+        """Open the WebSocket connection to the gateway, or return None if unavailable."""
+        # This would establish the WebSocket connection
+        return None
+    
+    def _send_loop(self, send_queue: "queue.Queue") -> None:
+        """Drain the send queue, sending each batch of commands as one JSON array frame."""
+        stop = False
+        while not stop:
+            batch = []
+            item = send_queue.get()
+            while True:
+                if item is _SEND_STOP:
+                    stop = True
+                    break
+                batch.append(item)
+                try:
+                    item = send_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if batch:
+                try:
+                    self._send_frame("[" + ",".join(batch) + "]")
+                except Exception as e:
+                    print(f"Warning: Failed to send {len(batch)} command(s) to OpenClaw: {e}")
+    
+    def _send_frame(self, frame: str) -> None:
+        """Write one frame to the OpenClaw Gateway connection."""
+        self._socket.send(frame)
+    
     def create_dashboard(self) -> Dict[str, Any]:
         """
         Create web dashboard for UE monitoring.
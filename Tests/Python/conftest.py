@@ -0,0 +1,16 @@
+"""
+Shared fixtures for the OpenClawUE Python tests.
+"""
+
+import sys
+import types
+
+import pytest
+
+
+@pytest.fixture
+def fake_unreal(monkeypatch):
+    """Install a stand-in 'unreal' module so Unreal-only code paths run."""
+    module = types.ModuleType("unreal")
+    monkeypatch.setitem(sys.modules, "unreal", module)
+    return module
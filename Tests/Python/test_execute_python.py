@@ -0,0 +1,63 @@
+"""
+Tests for openclawue.execute_python.
+"""
+
+import sys
+import threading
+
+import openclawue
+
+
+def test_captures_stdout(fake_unreal):
+    result = openclawue.execute_python("print('hello')")
+    
+    assert result == {"stdout": "hello\n", "stderr": "", "success": True}
+
+
+def test_error_is_separated_from_captured_stderr(fake_unreal):
+    result = openclawue.execute_python("import sys; sys.stderr.write('w'); 1/0")
+    
+    assert result["success"] is False
+    assert result["stderr"] == "w\ndivision by zero"
+
+
+def test_nested_call_gets_its_own_buffers(fake_unreal):
+    code = "import openclawue; print(openclawue.execute_python('print(5)')['stdout'], end='')"
+    
+    result = openclawue.execute_python(code)
+    
+    assert result["stdout"] == "5\n"
+
+
+def test_concurrent_calls_restore_process_streams(fake_unreal):
+    stdout, stderr = sys.stdout, sys.stderr
+    failures = []
+    
+    def run():
+        for _ in range(3000):
+            result = openclawue.execute_python("print(1)")
+            if result["stdout"] != "1\n":
+                failures.append(result)
+    
+    # Switch threads as often as possible so redirects overlap
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=run) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    
+    assert failures == []
+    assert sys.stdout is stdout
+    assert sys.stderr is stderr
+
+
+def test_stub_mode_reports_unavailable():
+    result = openclawue.execute_python("print('hello')")
+    
+    assert result["success"] is False
+    assert result["stdout"] == ""
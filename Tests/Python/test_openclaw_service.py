@@ -0,0 +1,117 @@
+"""
+Tests for openclawue.services.OpenClawService.
+"""
+
+import json
+import threading
+
+import pytest
+
+from openclawue.services import OpenClawService
+
+
+class FakeSocket:
+    """Records frames; the first send blocks until released."""
+    
+    def __init__(self):
+        self.frames = []
+        self.first_send = threading.Event()
+        self.release = threading.Event()
+    
+    def send(self, frame):
+        if not self.first_send.is_set():
+            self.first_send.set()
+            self.release.wait(5)
+        self.frames.append(frame)
+    
+    def commands(self):
+        return [command for frame in self.frames for command in json.loads(frame)]
+
+
+@pytest.fixture
+def socket():
+    return FakeSocket()
+
+
+@pytest.fixture
+def service(socket, monkeypatch):
+    service = OpenClawService()
+    monkeypatch.setattr(service, "_open_socket", lambda url: socket)
+    yield service
+    socket.release.set()
+    service.disconnect_from_openclaw()
+
+
+def test_send_requires_connection():
+    result = OpenClawService().send_to_openclaw({"command": "test"})
+    
+    assert result == {"success": False, "error": "Not connected to OpenClaw"}
+
+
+@pytest.mark.parametrize("command", [{"data": {1, 2}}, b"raw", 2 ** 70])
+def test_stub_send_does_not_encode(command):
+    service = OpenClawService()
+    service.connect_to_openclaw()
+    
+    result = service.send_to_openclaw(command)
+    
+    assert result["success"] is True
+    assert "queued" not in result
+
+
+def test_pending_commands_are_batched(service, socket):
+    service.connect_to_openclaw()
+    service.send_to_openclaw({"i": 0})
+    assert socket.first_send.wait(5)
+    
+    # The sender is blocked on the first frame; these pile up behind it
+    for i in range(1, 5):
+        assert service.send_to_openclaw({"i": i})["queued"] is True
+    socket.release.set()
+    service.disconnect_from_openclaw()
+    
+    assert socket.commands() == [{"i": i} for i in range(5)]
+    assert len(socket.frames) == 2
+
+
+def test_unencodable_command_fails_synchronously(service, socket):
+    service.connect_to_openclaw()
+    
+    result = service.send_to_openclaw({"data": object()})
+    
+    assert result["success"] is False
+    assert result["error_type"] == "TypeError"
+
+
+def test_disconnect_stops_sender(service, socket):
+    service.connect_to_openclaw()
+    sender = service._sender_thread
+    socket.release.set()
+    
+    service.disconnect_from_openclaw()
+    
+    assert not sender.is_alive()
+    assert service.send_to_openclaw({"i": 0})["success"] is False
+
+
+def test_concurrent_disconnects_do_not_poison_reconnect(service, socket):
+    service.connect_to_openclaw()
+    socket.release.set()
+    
+    threads = [threading.Thread(target=service.disconnect_from_openclaw) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    service.connect_to_openclaw()
+    service.send_to_openclaw({"i": 1})
+    service.disconnect_from_openclaw()
+    
+    assert socket.commands()[-1] == {"i": 1}
+
+
+def test_frames_are_compact_json_text():
+    from openclawue.services import _json_dumps
+    
+    assert _json_dumps({"data": {1: 2}}) == '{"data":{"1":2}}'